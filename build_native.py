@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Optional native build for Simple Game Save Sync
+Compiles simple_sync.py to a C extension with mypyc
+
+Usage:
+    pip install mypy
+    python build_native.py build_ext --inplace
+
+The compiled module is placed next to simple_sync.py and is picked up by
+`import simple_sync` ahead of the .py file. Delete the generated
+simple_sync.*.so / .pyd to go back to the pure Python version.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="simple_sync",
+    ext_modules=mypycify(["simple_sync.py"]),
+)
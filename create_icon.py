@@ -5,8 +5,54 @@ Requires: pip install Pillow
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+from functools import lru_cache
 import os
 
+# The helpers below are cached per size, so callers must treat the returned
+# images as read-only (copy them before drawing on them).
+
+@lru_cache(maxsize=32)
+def _make_mask(size, corner_radius):
+    """Create the rounded corner alpha mask."""
+    mask = Image.new('L', (size, size), 0)
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.rounded_rectangle([(0, 0), (size, size)], corner_radius, fill=255)
+    mask.load()
+    return mask
+
+@lru_cache(maxsize=32)
+def _make_border(size, corner_radius, width):
+    """Create the subtle white border overlay."""
+    border_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    border_draw = ImageDraw.Draw(border_img)
+    border_draw.rounded_rectangle(
+        [(width//2, width//2), (size-width//2, size-width//2)],
+        corner_radius,
+        outline=(255, 255, 255, 60),
+        width=width
+    )
+    border_img.load()
+    return border_img
+
+@lru_cache(maxsize=32)
+def _make_shadow(size, corner_radius):
+    """Create the blurred drop shadow behind the icon."""
+    # Blur at quarter resolution and scale back up; the shadow is soft
+    # enough that the lost detail isn't visible
+    scale = 4
+    small = size // scale
+    shadow = Image.new('RGBA', (small, small), (0, 0, 0, 0))
+    shadow_draw = ImageDraw.Draw(shadow)
+    shadow_draw.rounded_rectangle(
+        [(0, 0), (small, small)],
+        corner_radius // scale,
+        fill=(0, 0, 0, 40)
+    )
+    shadow = shadow.filter(ImageFilter.GaussianBlur(10 / scale))
+    shadow = shadow.resize((size, size), Image.Resampling.BILINEAR)
+    shadow.load()
+    return shadow
+
 def create_tahoe_icon(input_path, output_path, size=1024):
     """
     Create a modern macOS (Tahoe) style icon with:
@@ -15,45 +61,27 @@ def create_tahoe_icon(input_path, output_path, size=1024):
     - Drop shadow
     - Centered logo
     """
-    # Create a new image with alpha channel
-    icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(icon)
-
     # Calculate rounded rectangle dimensions
     # macOS icons use approximately 22.37% corner radius
     corner_radius = int(size * 0.2237)
 
     # Create rounded rectangle background with gradient
     # Using a blue gradient similar to macOS style
-    for y in range(size):
-        # Gradient from lighter blue at top to darker at bottom
-        r = int(59 + (30 - 59) * (y / size))
-        g = int(130 + (90 - 130) * (y / size))
-        b = int(246 + (200 - 246) * (y / size))
-        color = (r, g, b, 255)
-
-        # Draw horizontal line for gradient
-        draw.rectangle([(0, y), (size, y+1)], fill=color)
-
-    # Create rounded corner mask
-    mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    mask_draw.rounded_rectangle([(0, 0), (size, size)], corner_radius, fill=255)
-
-    # Apply mask to create rounded corners
-    icon.putalpha(mask)
+    # Gradient from lighter blue at top to darker at bottom
+    ramp = Image.linear_gradient('L').resize((size, size))
+    channels = [
+        ramp.point(lambda v, lo=top, hi=bottom: int(lo + (hi - lo) * v / 255))
+        for top, bottom in ((59, 30), (130, 90), (246, 200))
+    ]
+    channels.append(Image.new('L', (size, size), 255))
+    icon = Image.merge('RGBA', channels)
+
+    # Apply rounded corner mask
+    icon.putalpha(_make_mask(size, corner_radius))
 
     # Add subtle border
-    border_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    border_draw = ImageDraw.Draw(border_img)
     border_width = max(2, int(size * 0.005))
-    border_draw.rounded_rectangle(
-        [(border_width//2, border_width//2), (size-border_width//2, size-border_width//2)],
-        corner_radius,
-        outline=(255, 255, 255, 60),
-        width=border_width
-    )
-    icon = Image.alpha_composite(icon, border_img)
+    icon = Image.alpha_composite(icon, _make_border(size, corner_radius, border_width))
 
     # Load and center the logo
     try:
@@ -67,29 +95,17 @@ def create_tahoe_icon(input_path, output_path, size=1024):
         logo_x = (size - logo.width) // 2
         logo_y = (size - logo.height) // 2
 
-        # Paste logo onto icon
-        icon.paste(logo, (logo_x, logo_y), logo)
+        # Composite logo onto icon
+        icon.alpha_composite(logo, (logo_x, logo_y))
     except Exception as e:
         print(f"Warning: Could not load logo: {e}")
         print("Creating icon with background only")
 
     # Add subtle drop shadow effect
-    shadow = Image.new('RGBA', (size + 40, size + 40), (0, 0, 0, 0))
-    shadow_draw = ImageDraw.Draw(shadow)
-    shadow_draw.rounded_rectangle(
-        [(20, 20), (size + 20, size + 20)],
-        corner_radius,
-        fill=(0, 0, 0, 40)
-    )
-    shadow = shadow.filter(ImageFilter.GaussianBlur(10))
-
-    # Composite shadow and icon
-    final = Image.new('RGBA', (size + 40, size + 40), (0, 0, 0, 0))
-    final.paste(shadow, (0, 0))
-    final.paste(icon, (20, 20), icon)
+    shadow = _make_shadow(size, corner_radius)
 
-    # Crop back to original size
-    final = final.crop((20, 20, size + 20, size + 20))
+    # Composite icon over its shadow
+    final = Image.alpha_composite(shadow, icon)
 
     # Save
     final.save(output_path, 'PNG')
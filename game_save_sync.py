@@ -6,6 +6,7 @@ Supports: Hollow Knight, Hollow Knight Silksong
 Platforms: macOS, Windows
 """
 
+import io
 import os
 import sys
 import platform
@@ -13,34 +14,88 @@ import shutil
 import json
 import time
 import argparse
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+# Google API modules are imported on first use by _import_google_modules(),
+# so --help and setup checks don't pay for loading them
+Credentials = InstalledAppFlow = Request = build = None
+MediaFileUpload = MediaIoBaseDownload = None
+
+class HttpError(Exception):
+    """Placeholder until googleapiclient.errors.HttpError is imported."""
+
+def _import_google_modules():
+    """Import the Google API client modules the first time they're needed."""
+    global Credentials, InstalledAppFlow, Request, build, HttpError
+    global MediaFileUpload, MediaIoBaseDownload
+
+    if build is not None:
+        return
+
+    try:
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+    except ImportError:
+        print("Error: Required packages not installed. Run: pip install -r requirements.txt")
+        sys.exit(1)
+
+# Optional: faster JSON serialization for the state files rewritten every sync
 try:
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    from googleapiclient.discovery import build
-    from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
-    import pickle
-    import io
+    import orjson
 except ImportError:
-    print("Error: Required packages not installed. Run: pip install -r requirements.txt")
-    sys.exit(1)
+    orjson = None
 
 # Google Drive API scope
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Files larger than this use a resumable upload session; smaller ones go in a single request
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# Download chunk size; larger chunks mean fewer HTTP requests per file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Refresh the access token when it has less than this many seconds left
+TOKEN_REFRESH_MARGIN_SECONDS = 5 * 60
+
+# Maximum number of concurrent transfers; one pool is shared by all games in a sync
+MAX_TRANSFER_WORKERS = 4
+
+def _dump_json(obj, path: str):
+    """Write obj to path as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=4)
+
 class GameSaveSync:
     def __init__(self, config_path: str = "config.json"):
         """Initialize the save sync system."""
         self.config_path = config_path
         self.config = self.load_config()
         self.platform = platform.system()
+        self._resolved_paths = self.resolve_local_save_paths()
         self.drive_service = None
-        self.credentials_path = "token.pickle"
+        self._creds = None
+        self._thread_local = threading.local()
+        self._cache_lock = threading.Lock()
+        self.credentials_path = "token.json"
+        self.legacy_credentials_path = "token.pickle"
         self.client_secrets_path = "credentials.json"
+        self.folder_cache_path = "folder_cache.json"
+        self.folder_id_cache = self.load_folder_cache()
+        self.sync_state_path = "sync_state.json"
+        self.sync_state = self.load_sync_state()
 
     def load_config(self) -> Dict:
         """Load configuration from JSON file."""
@@ -79,37 +134,132 @@ class GameSaveSync:
             "verbose": True
         }
 
-        with open(self.config_path, 'w') as f:
-            json.dump(default_config, f, indent=4)
+        _dump_json(default_config, self.config_path)
 
         print(f"Created default config at {self.config_path}")
         return default_config
 
+    def load_folder_cache(self) -> Dict[str, str]:
+        """Load cached Google Drive folder IDs keyed by folder path."""
+        if not os.path.exists(self.folder_cache_path):
+            return {}
+
+        try:
+            with open(self.folder_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_folder_cache(self):
+        """Persist the folder ID cache to disk."""
+        _dump_json(self.folder_id_cache, self.folder_cache_path)
+
+    def invalidate_folder_id(self, folder_id: str):
+        """Drop any cached folder paths that resolve to a stale folder ID."""
+        with self._cache_lock:
+            stale = [path for path, cached_id in self.folder_id_cache.items() if cached_id == folder_id]
+            for path in stale:
+                del self.folder_id_cache[path]
+            if stale:
+                self.save_folder_cache()
+
+    def load_sync_state(self) -> Dict:
+        """Load local file stats and the Drive changes token from the last sync."""
+        state = {"files": {}, "checksums": {}, "page_token": None}
+        if not os.path.exists(self.sync_state_path):
+            return state
+
+        try:
+            with open(self.sync_state_path, 'r') as f:
+                state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return state
+
+    def save_sync_state(self):
+        """Persist the sync state to disk."""
+        _dump_json(self.sync_state, self.sync_state_path)
+
+    def get_file_signature(self, file_path: Path) -> Optional[List[int]]:
+        """Get a cheap (mtime_ns, size) signature of a local file."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def get_local_md5(self, file_path: Path, signature: Optional[List[int]] = None) -> Optional[str]:
+        """Get the MD5 of a local file, reusing the cached value while it's unchanged."""
+        if signature is None:
+            signature = self.get_file_signature(file_path)
+        if not signature:
+            return None
+
+        checksums = self.sync_state['checksums']
+        cached = checksums.get(str(file_path))
+        if cached and cached[:2] == signature:
+            return cached[2]
+
+        md5 = hashlib.md5(file_path.read_bytes()).hexdigest()
+        checksums[str(file_path)] = signature + [md5]
+        return md5
+
+    def resolve_local_save_paths(self) -> Dict[str, Path]:
+        """Resolve the local save path of every enabled game on this platform once."""
+        resolved = {}
+        for game_name, game_config in self.config['games'].items():
+            if not game_config.get('enabled'):
+                continue
+
+            path_str = game_config['paths'].get(self.platform)
+            if not path_str:
+                continue
+
+            # Expand environment variables and user home
+            resolved[game_name] = Path(os.path.expanduser(os.path.expandvars(path_str)))
+
+        return resolved
+
     def get_local_save_path(self, game_name: str) -> Optional[Path]:
         """Get the local save path for a game based on the current platform."""
         game_config = self.config['games'].get(game_name)
         if not game_config or not game_config['enabled']:
             return None
 
-        path_str = game_config['paths'].get(self.platform)
-        if not path_str:
+        path = self._resolved_paths.get(game_name)
+        if not path:
             print(f"Warning: No path configured for {game_name} on {self.platform}")
-            return None
+        return path
+
+    def migrate_legacy_credentials(self):
+        """Convert a token.pickle from older versions to token.json."""
+        if not os.path.exists(self.legacy_credentials_path) or os.path.exists(self.credentials_path):
+            return
 
-        # Expand environment variables and user home
-        path_str = os.path.expandvars(path_str)
-        path_str = os.path.expanduser(path_str)
+        import pickle
+        _import_google_modules()
+        try:
+            with open(self.legacy_credentials_path, 'rb') as token:
+                creds = pickle.load(token)
+            self.save_credentials(creds)
+            os.remove(self.legacy_credentials_path)
+        except Exception as e:
+            print(f"Warning: Could not migrate {self.legacy_credentials_path}: {str(e)}")
 
-        return Path(path_str)
+    def save_credentials(self, creds):
+        """Save OAuth credentials for the next run."""
+        with open(self.credentials_path, 'w') as token:
+            token.write(creds.to_json())
 
     def authenticate_google_drive(self):
         """Authenticate with Google Drive API."""
+        _import_google_modules()
         creds = None
+        self.migrate_legacy_credentials()
 
         # Load existing credentials
         if os.path.exists(self.credentials_path):
-            with open(self.credentials_path, 'rb') as token:
-                creds = pickle.load(token)
+            creds = Credentials.from_authorized_user_file(self.credentials_path, SCOPES)
 
         # Refresh or get new credentials
         if not creds or not creds.valid:
@@ -126,15 +276,89 @@ class GameSaveSync:
                 creds = flow.run_local_server(port=0)
 
             # Save credentials for next run
-            with open(self.credentials_path, 'wb') as token:
-                pickle.dump(creds, token)
+            self.save_credentials(creds)
 
+        self._creds = creds
         self.drive_service = build('drive', 'v3', credentials=creds)
         if self.config.get('verbose'):
             print("✓ Successfully authenticated with Google Drive")
 
+    def _ensure_fresh_creds(self):
+        """Refresh the access token before it expires mid-sync."""
+        creds = self._creds
+        if not creds or not creds.refresh_token:
+            return
+
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expiring = creds.expiry is not None and (
+            creds.expiry - now).total_seconds() < TOKEN_REFRESH_MARGIN_SECONDS
+        if creds.expired or expiring:
+            try:
+                creds.refresh(Request())
+                self.save_credentials(creds)
+            except Exception as e:
+                print(f"Warning: Could not refresh Google Drive credentials: {str(e)}")
+
+    def get_drive_service(self):
+        """
+        Get a Drive client for the calling thread.
+        The underlying httplib2 connection is not thread-safe, so worker
+        threads each build their own client from the shared credentials.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.drive_service
+
+        service = getattr(self._thread_local, 'drive_service', None)
+        if service is None:
+            service = build('drive', 'v3', credentials=self._creds)
+            self._thread_local.drive_service = service
+        return service
+
+    def get_changed_folder_ids(self) -> Optional[Set[str]]:
+        """
+        Get the IDs of Drive folders whose contents changed since the last sync.
+        Returns None when changes can't be tracked and every game must be checked.
+        """
+        page_token = self.sync_state.get('page_token')
+        changes = self.drive_service.changes()
+
+        try:
+            if not page_token:
+                response = changes.getStartPageToken().execute()
+                self.sync_state['page_token'] = response['startPageToken']
+                return None
+
+            changed = set()
+            while page_token:
+                response = changes.list(
+                    pageToken=page_token,
+                    spaces='drive',
+                    fields='nextPageToken, newStartPageToken, changes(removed, file(parents))'
+                ).execute()
+
+                for change in response.get('changes', []):
+                    if change.get('removed') or 'file' not in change:
+                        # Can't tell which folder lost a file, so check them all
+                        return None
+                    changed.update(change['file'].get('parents', []))
+
+                if 'newStartPageToken' in response:
+                    self.sync_state['page_token'] = response['newStartPageToken']
+                page_token = response.get('nextPageToken')
+
+            return changed
+        except Exception as e:
+            print(f"Warning: Could not fetch Drive changes: {str(e)}")
+            self.sync_state['page_token'] = None
+            return None
+
     def get_or_create_folder(self, folder_path: str) -> str:
         """Get or create a folder in Google Drive by path."""
+        cached_id = self.folder_id_cache.get(folder_path)
+        if cached_id:
+            return cached_id
+
         folder_names = folder_path.split('/')
         parent_id = 'root'
 
@@ -164,85 +388,122 @@ class GameSaveSync:
                 ).execute()
                 parent_id = folder['id']
 
+        self.folder_id_cache[folder_path] = parent_id
+        self.save_folder_cache()
         return parent_id
 
-    def get_file_in_folder(self, filename: str, folder_id: str) -> Optional[Dict]:
-        """Get a file from Google Drive folder."""
-        query = f"name='{filename}' and '{folder_id}' in parents and trashed=false"
-        results = self.drive_service.files().list(
-            q=query,
-            spaces='drive',
-            fields='files(id, name, modifiedTime)'
-        ).execute()
+    def list_files_in_folder(self, folder_id: str) -> Dict[str, Dict]:
+        """List all files in a Google Drive folder, keyed by filename."""
+        query = f"'{folder_id}' in parents and trashed=false"
+        files = {}
+        page_token = None
+
+        while True:
+            results = self.get_drive_service().files().list(
+                q=query,
+                spaces='drive',
+                pageSize=100,
+                fields='nextPageToken, files(id, name, modifiedTime, md5Checksum)',
+                pageToken=page_token
+            ).execute()
 
-        files = results.get('files', [])
-        return files[0] if files else None
+            for f in results.get('files', []):
+                files.setdefault(f['name'], f)
 
-    def upload_file(self, local_path: Path, filename: str, folder_id: str) -> bool:
-        """Upload a file to Google Drive."""
-        try:
-            # Check if file already exists
-            existing_file = self.get_file_in_folder(filename, folder_id)
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return files
 
+    def upload_file(self, local_path: Path, filename: str, folder_id: str,
+                    file_id: Optional[str] = None) -> bool:
+        """
+        Upload a file to Google Drive.
+        file_id is the existing Drive file to update, or None to create a new one.
+        """
+        try:
             file_metadata = {
                 'name': filename,
                 'parents': [folder_id]
             }
-            media = MediaFileUpload(str(local_path), resumable=True)
-
-            if existing_file:
+            resumable = local_path.stat().st_size > RESUMABLE_UPLOAD_THRESHOLD
+            media = MediaFileUpload(
+                str(local_path),
+                mimetype='application/octet-stream',
+                resumable=resumable
+            )
+
+            if file_id:
                 # Update existing file
-                file = self.drive_service.files().update(
-                    fileId=existing_file['id'],
+                file = self.get_drive_service().files().update(
+                    fileId=file_id,
                     media_body=media
                 ).execute()
             else:
                 # Create new file
-                file = self.drive_service.files().create(
+                file = self.get_drive_service().files().create(
                     body=file_metadata,
                     media_body=media,
                     fields='id'
                 ).execute()
 
             return True
+        except HttpError as e:
+            if e.resp.status == 404:
+                self.invalidate_folder_id(folder_id)
+            print(f"Error uploading {filename}: {str(e)}")
+            return False
         except Exception as e:
             print(f"Error uploading {filename}: {str(e)}")
             return False
 
-    def download_file(self, file_id: str, local_path: Path) -> bool:
-        """Download a file from Google Drive."""
+    def download_file(self, file_id: str, local_path: Path, folder_id: Optional[str] = None) -> bool:
+        """
+        Download a file from Google Drive.
+        The file is written to a .part file first and only replaces the
+        existing save once fully downloaded.
+        """
+        temp_path = local_path.with_suffix(local_path.suffix + '.part')
         try:
-            request = self.drive_service.files().get_media(fileId=file_id)
+            request = self.get_drive_service().files().get_media(fileId=file_id)
 
             # Ensure parent directory exists
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with io.FileIO(str(local_path), 'wb') as fh:
-                downloader = MediaIoBaseDownload(fh, request)
+            with io.FileIO(str(temp_path), 'wb') as fh:
+                downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
                 done = False
                 while not done:
                     status, done = downloader.next_chunk()
+                os.fsync(fh.fileno())
 
+            os.replace(temp_path, local_path)
             return True
+        except HttpError as e:
+            if e.resp.status == 404 and folder_id:
+                self.invalidate_folder_id(folder_id)
+            print(f"Error downloading to {local_path}: {str(e)}")
         except Exception as e:
             print(f"Error downloading to {local_path}: {str(e)}")
-            return False
 
-    def get_file_timestamp(self, file_path: Path) -> Optional[float]:
-        """Get modification timestamp of a local file."""
         try:
-            return file_path.stat().st_mtime
-        except:
-            return None
+            temp_path.unlink()
+        except OSError:
+            pass
+        return False
 
     def parse_drive_timestamp(self, timestamp_str: str) -> float:
         """Parse Google Drive timestamp string to Unix timestamp."""
         dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
         return dt.timestamp()
 
-    def sync_game_saves(self, game_name: str) -> Tuple[int, int]:
+    def sync_game_saves(self, game_name: str, executor: ThreadPoolExecutor,
+                        changed_folders: Optional[Set[str]] = None) -> Tuple[int, int]:
         """
         Sync save files for a specific game.
+        Transfers run on executor, which is shared across games so each worker
+        thread keeps its Drive client for the whole sync.
+        If changed_folders is given, a game whose cloud folder isn't in it and
+        whose local saves are unchanged since the last sync is skipped.
         Returns: (uploads_count, downloads_count)
         """
         game_config = self.config['games'].get(game_name)
@@ -266,17 +527,51 @@ class GameSaveSync:
         downloads = 0
         verbose = self.config.get('verbose', False)
 
-        # Check each save file
+        # Read the save directory once instead of probing each save file
+        with os.scandir(local_path) as it:
+            entries = {e.name: e for e in it if e.is_file()}
+        local_stats = {name: entries[name].stat() for name in game_config['save_files'] if name in entries}
+
+        # Skip the Drive lookup entirely when nothing changed on either side
+        known_files = self.sync_state['files']
+        signatures = {}
+        for save_file in game_config['save_files']:
+            local_stat = local_stats.get(save_file)
+            signatures[str(local_path / save_file)] = (
+                [local_stat.st_mtime_ns, local_stat.st_size] if local_stat else None)
+
+        # A save missing locally may still need pulling from the cloud, so
+        # only skip when every save was recorded as present and unchanged
+        if changed_folders is not None and folder_id not in changed_folders and all(
+                signature is not None and known_files.get(path) == signature
+                for path, signature in signatures.items()):
+            if verbose:
+                print("  ✓ No changes since last sync")
+            return 0, 0
+
+        # Fetch metadata for every cloud save in one request
+        cloud_files = self.list_files_in_folder(folder_id)
+
+        # Decide what to do with each save file
+        transfers = []
         for save_file in game_config['save_files']:
             local_file = local_path / save_file
+            local_stat = local_stats.get(save_file)
 
             # Get cloud file info
-            cloud_file = self.get_file_in_folder(save_file, folder_id)
+            cloud_file = cloud_files.get(save_file)
 
             # Determine if we need to sync
-            if local_file.exists() and cloud_file:
+            if local_stat and cloud_file:
+                # Identical content needs no transfer, whatever the timestamps say
+                signature = signatures[str(local_file)]
+                if cloud_file.get('md5Checksum') == self.get_local_md5(local_file, signature):
+                    if verbose:
+                        print(f"  ✓ {save_file} is in sync")
+                    continue
+
                 # Both exist - compare timestamps
-                local_time = self.get_file_timestamp(local_file)
+                local_time = local_stat.st_mtime
                 cloud_time = self.parse_drive_timestamp(cloud_file['modifiedTime'])
 
                 # Add 1 second buffer to account for timestamp precision
@@ -284,31 +579,59 @@ class GameSaveSync:
                     # Local is newer - upload
                     if verbose:
                         print(f"  ↑ Uploading {save_file} (local is newer)")
-                    if self.upload_file(local_file, save_file, folder_id):
-                        uploads += 1
+                    transfers.append(('upload', local_file, save_file))
                 elif cloud_time > local_time + 1:
                     # Cloud is newer - download
                     if verbose:
                         print(f"  ↓ Downloading {save_file} (cloud is newer)")
-                    if self.download_file(cloud_file['id'], local_file):
-                        downloads += 1
+                    transfers.append(('download', local_file, cloud_file['id']))
                 else:
                     if verbose:
                         print(f"  ✓ {save_file} is in sync")
 
-            elif local_file.exists() and not cloud_file:
+            elif local_stat and not cloud_file:
                 # Only local exists - upload
                 if verbose:
                     print(f"  ↑ Uploading {save_file} (new to cloud)")
-                if self.upload_file(local_file, save_file, folder_id):
-                    uploads += 1
+                transfers.append(('upload', local_file, save_file))
 
-            elif not local_file.exists() and cloud_file:
+            elif not local_stat and cloud_file:
                 # Only cloud exists - download
                 if verbose:
                     print(f"  ↓ Downloading {save_file} (new to local)")
-                if self.download_file(cloud_file['id'], local_file):
-                    downloads += 1
+                transfers.append(('download', local_file, cloud_file['id']))
+
+        def run_transfer(transfer):
+            action, local_file, target = transfer
+            if action == 'upload':
+                # Reuse the id from the folder listing instead of looking it up again
+                existing_file = cloud_files.get(target)
+                file_id = existing_file['id'] if existing_file else None
+                return action, self.upload_file(local_file, target, folder_id, file_id)
+            return action, self.download_file(target, local_file, folder_id)
+
+        # Transfers are network-bound, so overlap them
+        failed = set()
+        futures = [executor.submit(run_transfer, t) for t in transfers]
+        for transfer, future in zip(transfers, futures):
+            action, succeeded = future.result()
+            if not succeeded:
+                failed.add(str(transfer[1]))
+            elif action == 'upload':
+                uploads += 1
+            else:
+                downloads += 1
+
+        # Remember what the local saves looked like once in sync
+        for path in signatures:
+            if path in failed:
+                known_files.pop(path, None)
+                continue
+            signature = self.get_file_signature(Path(path))
+            if signature:
+                known_files[path] = signature
+            else:
+                known_files.pop(path, None)
 
         return uploads, downloads
 
@@ -321,20 +644,26 @@ class GameSaveSync:
 
         if not self.drive_service:
             self.authenticate_google_drive()
+        else:
+            self._ensure_fresh_creds()
 
         total_uploads = 0
         total_downloads = 0
+        changed_folders = self.get_changed_folder_ids()
 
-        for game_name, game_config in self.config['games'].items():
-            if not game_config['enabled']:
-                continue
+        with ThreadPoolExecutor(max_workers=MAX_TRANSFER_WORKERS) as executor:
+            for game_name, game_config in self.config['games'].items():
+                if not game_config['enabled']:
+                    continue
+
+                print(f"\nSyncing: {game_name}")
+                print(f"{'-'*60}")
 
-            print(f"\nSyncing: {game_name}")
-            print(f"{'-'*60}")
+                uploads, downloads = self.sync_game_saves(game_name, executor, changed_folders)
+                total_uploads += uploads
+                total_downloads += downloads
 
-            uploads, downloads = self.sync_game_saves(game_name)
-            total_uploads += uploads
-            total_downloads += downloads
+        self.save_sync_state()
 
         print(f"\n{'='*60}")
         print(f"Sync complete: {total_uploads} uploaded, {total_downloads} downloaded")
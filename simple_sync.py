@@ -5,29 +5,255 @@ User specifies game folder and cloud storage location
 """
 
 import os
-import shutil
-import platform
+import re
+import sys
+import time
+import errno
+import fnmatch
+import heapq
 from pathlib import Path
-from datetime import datetime
 import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Optional: faster JSON for sync_config.json, which grows with the file index
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it doesn't exist."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+# Buffer size for copying save files (256 KiB)
+COPY_BUFFER_SIZE = 1 << 18
+
+# Saves larger than this only have their changed blocks rewritten
+DELTA_COPY_THRESHOLD = 4 * 1024 * 1024
+DELTA_BLOCK_SIZE = 1 << 16
+
+# Whether os.copy_file_range works on this system; probed on first copy
+_HAS_CFR = sys.platform.startswith('linux') and hasattr(os, 'copy_file_range')
+
+def _kernel_copy(fsrc, fdst):
+    """
+    Copy between two open files without going through Python buffers.
+    Returns False if no zero-copy path is available for these files.
+    """
+    global _HAS_CFR
+
+    if sys.platform == 'darwin':
+        import shutil
+        # Raised by shutil's private fast-copy helpers when they can't handle a file
+        give_up = getattr(shutil, '_GiveupOnFastCopy', OSError)
+        try:
+            import posix
+            shutil._fastcopy_fcopyfile(fsrc, fdst, posix._COPYFILE_DATA)
+            return True
+        except (OSError, AttributeError, give_up):
+            return False
+
+    if not _HAS_CFR:
+        return False
+
+    # Let the kernel copy (enables reflinks and server-side NFS copies)
+    copied = 0
+    try:
+        while True:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+            if not n:
+                break
+            copied += n
+    except OSError as e:
+        if e.errno == errno.ENOSYS:
+            _HAS_CFR = False
+        elif e.errno not in (errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+            raise
+        return False
+
+    # Some FUSE and network filesystems return 0 without copying anything,
+    # so only trust the kernel copy if it moved data
+    return copied > 0
+
+
+def _fastcopy(src: str, dst: str) -> None:
+    """Copy a file's contents and metadata, like shutil.copy2, with a large buffer."""
+    import shutil
+
+    if os.name == 'nt':
+        # shutil uses CopyFile2 here on recent Pythons, which beats a manual loop
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if not _kernel_copy(fsrc, fdst):
+            # Fall back to a buffered copy from wherever the kernel copy stopped
+            buf = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                fdst.write(view[:n])
+
+    shutil.copystat(src, dst)
+
+
+def _digest(path: str) -> str:
+    """Compute a content digest of a file."""
+    import hashlib
+
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _index_matches(entry: Optional[List[Any]], file_stat: os.stat_result) -> bool:
+    """Check whether an index entry still describes a file's current size and mtime."""
+    return entry is not None and entry[0] == file_stat.st_size and entry[1] == file_stat.st_mtime_ns
+
+
+def _is_wildcard(pattern: str) -> bool:
+    """Check whether a save file pattern needs glob matching."""
+    return '*' in pattern or '?' in pattern
+
+
+@lru_cache(maxsize=None)
+def _wildcard_regex(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile a tuple of wildcard save patterns into one regex, or None if there are none."""
+    source = '|'.join(fnmatch.translate(p) for p in patterns)
+    if not source:
+        return None
+    return re.compile(source, re.IGNORECASE if os.name == 'nt' else 0)
+
+
+def _collect(dir_path: str, regex: Optional[Pattern[str]]) -> List[str]:
+    """List, in sorted order, the names of files in dir_path matching a _wildcard_regex() pattern."""
+    if regex is None:
+        return []
+
+    try:
+        with os.scandir(dir_path) as it:
+            return sorted(e.name for e in it if not e.is_dir() and regex.match(e.name))
+    except FileNotFoundError:
+        return []
+
+
+def _delta_copy(src: str, dst: str, block: int = DELTA_BLOCK_SIZE) -> None:
+    """
+    Update dst in place so it matches src, rewriting only the blocks that differ.
+    Falls back to a full copy when dst is missing or its size changed.
+    """
+    import mmap
+    import shutil
+
+    src_size = os.path.getsize(src)
+    dst_stat = _stat(dst)
+    if dst_stat is None or dst_stat.st_size != src_size or src_size == 0:
+        _fastcopy(src, dst)
+        return
+
+    with open(src, 'rb') as fsrc, open(dst, 'r+b') as fdst, \
+            mmap.mmap(fsrc.fileno(), 0, access=mmap.ACCESS_READ) as msrc, \
+            mmap.mmap(fdst.fileno(), 0, access=mmap.ACCESS_WRITE) as mdst:
+        for offset in range(0, src_size, block):
+            src_block = msrc[offset:offset + block]
+            if mdst[offset:offset + block] != src_block:
+                mdst[offset:offset + block] = src_block
+        mdst.flush()
+
+    shutil.copystat(src, dst)
+
+
+def _dedup(names: Iterable[str]) -> Iterator[str]:
+    """Drop repeats from a sorted stream of names."""
+    previous = None
+    for name in names:
+        if name != previous:
+            yield name
+        previous = name
+
+
+def _try_copy(task: Tuple[str, str, str]) -> Optional[OSError]:
+    """Run a queued (action, src, dst) copy, returning the error instead of raising it."""
+    _, src, dst = task
+    try:
+        if os.path.getsize(src) > DELTA_COPY_THRESHOLD:
+            _delta_copy(src, dst)
+        else:
+            _fastcopy(src, dst)
+        return None
+    except OSError as e:
+        return e
+
+
+# Separator between save file patterns entered by the user
+_SPLIT = re.compile(r'\s*,\s*')
+
+# A folder listing is only reused once the folder has been unchanged this
+# long, since coarse filesystem timestamps can hide changes within a second
+FOLDER_SETTLE_NS = 2 * 10**9
+
+# Maximum number of files copied at the same time
+MAX_COPY_WORKERS = 8
+
 
 class InteractiveGameSync:
     def __init__(self):
-        self.platform = platform.system()
         self.config_file = Path("sync_config.json")
         self.config = self.load_config()
+        self.config_changed = False
 
     def load_config(self):
         """Load saved configuration."""
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         return {"games": []}
 
     def save_config(self):
         """Save configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.config, indent=2).encode()
+
+        # Write a temporary file and swap it in, so an interrupted save
+        # never leaves a half-written config behind
+        tmp = self.config_file.with_name(self.config_file.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.config_file)
+
+    def get_digest(self, index, file_name, file_path, file_stat):
+        """Get a file's content digest, reusing the indexed one if size and mtime match."""
+        entry = index.get(file_name)
+        if _index_matches(entry, file_stat) and entry[2]:
+            return entry[2]
+        return _digest(file_path)
+
+    def update_index(self, index, file_name, file_stat, digest=None):
+        """Record a file's state after it was found or made in sync."""
+        if file_stat is None:
+            if index.pop(file_name, None) is not None:
+                self.config_changed = True
+            return
+
+        entry = [file_stat.st_size, file_stat.st_mtime_ns, digest]
+        if index.get(file_name) != entry:
+            index[file_name] = entry
+            self.config_changed = True
 
     def get_user_input(self, prompt, default=None):
         """Get input from user with optional default."""
@@ -59,18 +285,11 @@ class InteractiveGameSync:
 
             return path
 
-    def get_file_timestamp(self, file_path: Path) -> float:
-        """Get the modification timestamp of a file."""
-        try:
-            return file_path.stat().st_mtime
-        except:
-            return 0
-
     def format_timestamp(self, timestamp: float) -> str:
         """Format timestamp for display."""
-        if timestamp == 0:
+        if not timestamp:
             return "Never"
-        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
 
     def setup_new_game(self):
         """Interactive setup for a new game."""
@@ -102,7 +321,7 @@ class InteractiveGameSync:
         print("   Separate multiple patterns with commas: save1.dat,save2.dat,save3.dat")
 
         save_files_input = input("\nSave file pattern(s): ").strip()
-        save_files = [f.strip() for f in save_files_input.split(',')]
+        save_files = [f for f in _SPLIT.split(save_files_input) if f]
 
         # Get cloud storage location
         print(f"\n☁️  Where should these saves be backed up in your cloud storage?")
@@ -153,11 +372,12 @@ class InteractiveGameSync:
             print(f"   Cloud:  {game['cloud_path']}")
             print(f"   Files:  {', '.join(game['save_files'])}")
 
-    def sync_game(self, game_config):
+    def sync_game(self, game_config: Dict[str, Any]) -> None:
         """Sync a specific game."""
         game_name = game_config["name"]
-        local_path = Path(game_config["local_path"]).expanduser()
-        cloud_path = Path(game_config["cloud_path"]).expanduser()
+        # Plain strings rather than Path objects, since they're joined per file
+        local_path = os.path.expanduser(game_config["local_path"])
+        cloud_path = os.path.expanduser(game_config["cloud_path"])
         save_patterns = game_config["save_files"]
 
         print(f"\n{'='*70}")
@@ -168,116 +388,225 @@ class InteractiveGameSync:
         print()
 
         # Create paths if they don't exist
-        cloud_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(cloud_path, exist_ok=True)
 
-        if not local_path.exists():
+        local_dir_stat = _stat(local_path)
+        if local_dir_stat is None:
             print(f"⚠️  Local save folder doesn't exist: {local_path}")
             print(f"   This is normal if you haven't played {game_name} on this machine.")
             print(f"   Checking for cloud saves to download...\n")
 
-        # Collect all save files matching patterns
-        save_files = []
-        if local_path.exists():
-            for pattern in save_patterns:
-                if '*' in pattern:
-                    save_files.extend(local_path.glob(pattern))
-                else:
-                    save_files.append(local_path / pattern)
-        else:
-            # If local doesn't exist, check cloud for files
-            for pattern in save_patterns:
-                if '*' in pattern:
-                    save_files.extend(cloud_path.glob(pattern))
-                else:
-                    save_files.append(Path(pattern))
-
-        # Get unique file names
-        file_names = set()
-        for f in save_files:
-            if f.exists():
-                file_names.add(f.name)
-
-        # Also check cloud for any files we might have missed
-        if cloud_path.exists():
-            for pattern in save_patterns:
-                if '*' in pattern:
-                    for f in cloud_path.glob(pattern):
-                        file_names.add(f.name)
+        # Literal names are checked by the stat in the sync loop below, so
+        # only wildcard patterns need a directory listing
+        literals = [p for p in save_patterns if not _is_wildcard(p)]
+        wildcards = [p for p in save_patterns if _is_wildcard(p)]
+        save_regex = _wildcard_regex(tuple(wildcards))
+
+        # Each source is sorted, so they can be merged without re-sorting
+        name_sources = [sorted(literals)]
+        if save_regex is not None:
+            folder_mtimes = [
+                local_dir_stat.st_mtime_ns if local_dir_stat else None,
+                os.stat(cloud_path).st_mtime_ns,
+            ]
+            if (game_config.get("folder_mtime_ns") == folder_mtimes
+                    and game_config.get("wildcard_patterns") == wildcards):
+                # Adding, removing or renaming files updates a folder's mtime,
+                # so unchanged folders still hold the same matching files
+                name_sources.append(game_config.get("wildcard_matches", []))
+            else:
+                matches = list(_dedup(heapq.merge(
+                    _collect(local_path, save_regex), _collect(cloud_path, save_regex))))
+                name_sources.append(matches)
+
+                settled = time.time_ns() - FOLDER_SETTLE_NS
+                if all(m is None or m < settled for m in folder_mtimes):
+                    game_config["folder_mtime_ns"] = folder_mtimes
+                    game_config["wildcard_patterns"] = wildcards
+                    game_config["wildcard_matches"] = matches
                 else:
-                    file_names.add(pattern)
+                    game_config.pop("folder_mtime_ns", None)
+                    game_config.pop("wildcard_patterns", None)
+                    game_config.pop("wildcard_matches", None)
+                self.config_changed = True
 
-        if not file_names:
-            print(f"  ℹ️  No save files found (neither local nor cloud)")
-            print(f"     Looking for: {', '.join(save_patterns)}")
-            return
+        # Per-file state from the last time each side was known to be in sync
+        index_local = game_config.setdefault("index_local", {})
+        index_cloud = game_config.setdefault("index_cloud", {})
 
         # Track statistics
         uploaded = 0
         downloaded = 0
         synced = 0
+        conflicts = 0
+
+        # Decide what to do with each file; copies are queued and run afterwards
+        messages: List[List[str]] = []
+        tasks: List[Tuple[str, str, str]] = []
+        task_lines: List[List[str]] = []
+        # Local aliases for names used on every iteration
+        join = os.path.join
+        stat = _stat
+        fmt = self.format_timestamp
+        for file_name in _dedup(heapq.merge(*name_sources)):
+            local_file = join(local_path, file_name)
+            cloud_file = join(cloud_path, file_name)
+
+            # One stat per file, reused for existence and timestamps
+            local_stat = stat(local_file)
+            cloud_stat = stat(cloud_file)
+            local_time = local_stat.st_mtime if local_stat else 0
+            cloud_time = cloud_stat.st_mtime if cloud_stat else 0
+
+            if local_stat is None and cloud_stat is None:
+                continue
 
-        # Sync each file
-        for file_name in sorted(file_names):
-            local_file = local_path / file_name
-            cloud_file = cloud_path / file_name
-
-            local_exists = local_file.exists()
-            cloud_exists = cloud_file.exists()
-
-            print(f"  {file_name}")
-
-            if local_exists and cloud_exists:
-                # Both exist - compare timestamps
-                local_time = self.get_file_timestamp(local_file)
-                cloud_time = self.get_file_timestamp(cloud_file)
+            lines = [f"  {file_name}"]
+            messages.append(lines)
+
+            if (local_stat is not None and cloud_stat is not None
+                    and _index_matches(index_local.get(file_name), local_stat)
+                    and _index_matches(index_cloud.get(file_name), cloud_stat)):
+                # Neither side changed since they were last in sync
+                lines.append(f"    ✓ Cached in sync ({fmt(local_time)})")
+                synced += 1
+
+            elif local_stat is not None and cloud_stat is not None:
+                # If both sides were recorded at the last sync, the side that
+                # changed since then wins, and changes on both sides conflict
+                local_entry = index_local.get(file_name)
+                cloud_entry = index_cloud.get(file_name)
+                local_changed = not _index_matches(local_entry, local_stat)
+                cloud_changed = not _index_matches(cloud_entry, cloud_stat)
+                has_history = local_entry is not None and cloud_entry is not None
+                conflict = has_history and local_changed and cloud_changed
+
+                # Cloud clients often rewrite files with new timestamps but the
+                # same contents, so check contents before trusting timestamps
+                digest: Optional[str] = None
+                if (local_stat.st_size == cloud_stat.st_size
+                        and (conflict or (not has_history and abs(local_time - cloud_time) > 1))):
+                    local_digest = self.get_digest(index_local, file_name, local_file, local_stat)
+                    if local_digest == self.get_digest(index_cloud, file_name, cloud_file, cloud_stat):
+                        digest = local_digest
+
+                if digest:
+                    lines.append(f"    ✓ In sync (identical contents)")
+                    self.update_index(index_local, file_name, local_stat, digest)
+                    self.update_index(index_cloud, file_name, cloud_stat, digest)
+                    synced += 1
 
+                elif conflict:
+                    # Both changed since the last sync - don't overwrite either
+                    lines.append(f"    ⚠️  Changed on both sides since the last sync")
+                    lines.append(f"       Local: {fmt(local_time)}")
+                    lines.append(f"       Cloud: {fmt(cloud_time)}")
+                    lines.append(f"       Skipped. Copy the save you want to keep over the other one.")
+                    conflicts += 1
+
+                elif has_history and local_changed:
+                    # Only local changed since the last sync - upload
+                    lines.append(f"    📤 Changed locally ({fmt(local_time)})")
+                    lines.append(f"       Cloud: {fmt(cloud_time)}")
+                    lines.append(f"       Uploading to cloud...")
+                    tasks.append(("upload", local_file, cloud_file))
+                    task_lines.append(lines)
+
+                elif has_history:
+                    # Only cloud changed since the last sync - download
+                    lines.append(f"    📥 Changed in cloud ({fmt(cloud_time)})")
+                    lines.append(f"       Local: {fmt(local_time)}")
+                    lines.append(f"       Downloading to local...")
+                    tasks.append(("download", cloud_file, local_file))
+                    task_lines.append(lines)
+
+                # No sync history - compare timestamps
                 # 1 second buffer for file system differences
-                if local_time > cloud_time + 1:
+                elif local_time > cloud_time + 1:
                     # Local is newer - upload
-                    print(f"    📤 Local is newer ({self.format_timestamp(local_time)})")
-                    print(f"       Cloud: {self.format_timestamp(cloud_time)}")
-                    print(f"       Uploading to cloud...")
-                    shutil.copy2(local_file, cloud_file)
-                    uploaded += 1
-                    print(f"       ✅ Uploaded")
+                    lines.append(f"    📤 Local is newer ({fmt(local_time)})")
+                    lines.append(f"       Cloud: {fmt(cloud_time)}")
+                    lines.append(f"       Uploading to cloud...")
+                    tasks.append(("upload", local_file, cloud_file))
+                    task_lines.append(lines)
 
                 elif cloud_time > local_time + 1:
                     # Cloud is newer - download
-                    print(f"    📥 Cloud is newer ({self.format_timestamp(cloud_time)})")
-                    print(f"       Local: {self.format_timestamp(local_time)}")
-                    print(f"       Downloading to local...")
-                    local_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(cloud_file, local_file)
-                    downloaded += 1
-                    print(f"       ✅ Downloaded")
+                    lines.append(f"    📥 Cloud is newer ({fmt(cloud_time)})")
+                    lines.append(f"       Local: {fmt(local_time)}")
+                    lines.append(f"       Downloading to local...")
+                    os.makedirs(local_path, exist_ok=True)
+                    tasks.append(("download", cloud_file, local_file))
+                    task_lines.append(lines)
 
                 else:
                     # In sync
-                    print(f"    ✓ In sync ({self.format_timestamp(local_time)})")
+                    lines.append(f"    ✓ In sync ({fmt(local_time)})")
+                    self.update_index(index_local, file_name, local_stat)
+                    self.update_index(index_cloud, file_name, cloud_stat)
                     synced += 1
 
-            elif local_exists and not cloud_exists:
+            elif local_stat is not None and cloud_stat is None:
                 # Only local exists - upload
-                print(f"    📤 Only exists locally ({self.format_timestamp(self.get_file_timestamp(local_file))})")
-                print(f"       Uploading to cloud...")
-                shutil.copy2(local_file, cloud_file)
-                uploaded += 1
-                print(f"       ✅ Uploaded")
+                lines.append(f"    📤 Only exists locally ({fmt(local_time)})")
+                lines.append(f"       Uploading to cloud...")
+                tasks.append(("upload", local_file, cloud_file))
+                task_lines.append(lines)
 
-            elif not local_exists and cloud_exists:
+            elif local_stat is None and cloud_stat is not None:
                 # Only cloud exists - download
-                print(f"    📥 Only exists in cloud ({self.format_timestamp(self.get_file_timestamp(cloud_file))})")
-                print(f"       Downloading to local...")
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(cloud_file, local_file)
+                lines.append(f"    📥 Only exists in cloud ({fmt(cloud_time)})")
+                lines.append(f"       Downloading to local...")
+                os.makedirs(local_path, exist_ok=True)
+                tasks.append(("download", cloud_file, local_file))
+                task_lines.append(lines)
+
+        if not messages:
+            print(f"  ℹ️  No save files found (neither local nor cloud)")
+            print(f"     Looking for: {', '.join(save_patterns)}")
+            return
+
+        # Copies are independent, so overlap their I/O
+        if len(tasks) < 2:
+            errors = [_try_copy(task) for task in tasks]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(tasks))) as executor:
+                errors = list(executor.map(_try_copy, tasks))
+
+        for (action, src, dst), lines, error in zip(tasks, task_lines, errors):
+            local_file, cloud_file = (src, dst) if action == "upload" else (dst, src)
+            file_name = os.path.basename(local_file)
+
+            if error:
+                lines.append(f"       ❌ Failed: {error}")
+                self.update_index(index_local, file_name, None)
+                self.update_index(index_cloud, file_name, None)
+                continue
+
+            if action == "upload":
+                uploaded += 1
+                lines.append(f"       ✅ Uploaded")
+            else:
                 downloaded += 1
-                print(f"       ✅ Downloaded")
+                lines.append(f"       ✅ Downloaded")
+            self.update_index(index_local, file_name, _stat(local_file))
+            self.update_index(index_cloud, file_name, _stat(cloud_file))
+
+        # Print each file's output in order, one write per file
+        write = sys.stdout.write
+        for lines in messages:
+            write("\n".join(lines) + "\n\n")
 
-            print()
+        if self.config_changed:
+            self.save_config()
+            self.config_changed = False
 
         # Summary
         print(f"{'='*70}")
         print(f"SUMMARY: ↑ {uploaded} uploaded  |  ↓ {downloaded} downloaded  |  ✓ {synced} in sync")
+        if conflicts:
+            print(f"⚠️  {conflicts} file(s) changed on both sides and were skipped")
         print(f"{'='*70}")
 
     def sync_all_games(self):
@@ -287,7 +616,7 @@ class InteractiveGameSync:
             return
 
         print("\n" + "="*70)
-        print(f"STARTING SYNC - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"STARTING SYNC - {time.strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*70)
 
         for game_config in self.config["games"]:
@@ -297,7 +626,8 @@ class InteractiveGameSync:
 
     def remove_game(self):
         """Remove a game from configuration."""
-        if not self.config["games"]:
+        games = self.config["games"]
+        if not games:
             print("\n❌ No games configured yet.")
             return
 
@@ -307,8 +637,8 @@ class InteractiveGameSync:
             choice = int(input("\nEnter game number to remove (0 to cancel): "))
             if choice == 0:
                 return
-            if 1 <= choice <= len(self.config["games"]):
-                removed_game = self.config["games"].pop(choice - 1)
+            if 1 <= choice <= len(games):
+                removed_game = games.pop(choice - 1)
                 self.save_config()
                 print(f"\n✅ Removed: {removed_game['name']}")
             else:
@@ -338,14 +668,15 @@ class InteractiveGameSync:
             elif choice == "3":
                 self.sync_all_games()
             elif choice == "4":
-                if not self.config["games"]:
+                games = self.config["games"]
+                if not games:
                     print("\n❌ No games configured yet.")
                     continue
                 self.list_games()
                 try:
                     game_num = int(input("\nEnter game number to sync: "))
-                    if 1 <= game_num <= len(self.config["games"]):
-                        self.sync_game(self.config["games"][game_num - 1])
+                    if 1 <= game_num <= len(games):
+                        self.sync_game(games[game_num - 1])
                     else:
                         print("\n❌ Invalid choice")
                 except ValueError: